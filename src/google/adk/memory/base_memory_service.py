@@ -13,6 +13,7 @@
 # limitations under the License.
 
 import abc
+import asyncio
 
 from pydantic import BaseModel
 from pydantic import Field
@@ -74,3 +75,26 @@ class BaseMemoryService(abc.ABC):
     Returns:
         A SearchMemoryResponse containing the matching memories.
     """
+
+  async def batch_search_memory(
+      self, *, app_name: str, user_id: str, queries: list[str]
+  ) -> list[SearchMemoryResponse]:
+    """Searches for sessions that match each of the queries.
+
+    The default implementation runs `search_memory` for all queries
+    concurrently. Subclasses may override it to use a native batch API.
+
+    Args:
+        app_name: The name of the application.
+        user_id: The id of the user.
+        queries: The queries to search for.
+
+    Returns:
+        A SearchMemoryResponse for each query, in the same order as `queries`.
+    """
+    return list(
+        await asyncio.gather(*[
+            self.search_memory(app_name=app_name, user_id=user_id, query=query)
+            for query in queries
+        ])
+    )
@@ -26,13 +26,18 @@ class InMemoryMemoryService(BaseMemoryService):
   """
 
   def __init__(self):
-    self.session_events: dict[str, list[Event]] = {}
-    """keys are app_name/user_id/session_id"""
+    self.session_events: dict[tuple[str, str], dict[str, list[Event]]] = {}
+    """keys are (app_name, user_id), then session_id"""
+    self._event_texts: dict[tuple[str, str], dict[str, list[str]]] = {}
+    """Lower-cased text of each event in `session_events`, same keys."""
 
   async def add_session_to_memory(self, session: Session):
-    key = f'{session.app_name}/{session.user_id}/{session.id}'
-    self.session_events[key] = [
-        event for event in session.events if event.content
+    user_key = (session.app_name, session.user_id)
+    events = [event for event in session.events if event.content]
+    self.session_events.setdefault(user_key, {})[session.id] = events
+    # Lower-case once at ingestion instead of on every search.
+    self._event_texts.setdefault(user_key, {})[session.id] = [
+        _event_text(event) for event in events
     ]
 
   async def search_memory(
@@ -41,22 +46,28 @@ class InMemoryMemoryService(BaseMemoryService):
     """Prototyping purpose only."""
     keywords = set(query.lower().split())
     response = SearchMemoryResponse()
-    for key, events in self.session_events.items():
-      if not key.startswith(f'{app_name}/{user_id}/'):
-        continue
+    user_key = (app_name, user_id)
+    if not keywords or user_key not in self.session_events:
+      # Nothing can match, so skip scanning the stored events.
+      return response
+    event_texts = self._event_texts[user_key]
+    for session_id, events in self.session_events[user_key].items():
       matched_events = []
-      for event in events:
-        if not event.content or not event.content.parts:
-          continue
-        parts = event.content.parts
-        text = '\n'.join([part.text for part in parts if part.text]).lower()
+      for event, text in zip(events, event_texts[session_id]):
         for keyword in keywords:
           if keyword in text:
             matched_events.append(event)
             break
       if matched_events:
-        session_id = key.split('/')[-1]
         response.memories.append(
             MemoryResult(session_id=session_id, events=matched_events)
         )
     return response
+
+
+def _event_text(event: Event) -> str:
+  """Returns the lower-cased text of an event, or '' if it has none."""
+  if not event.content or not event.content.parts:
+    return ''
+  parts = event.content.parts
+  return '\n'.join([part.text for part in parts if part.text]).lower()
@@ -12,8 +12,10 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-from collections import OrderedDict
+import asyncio
+from collections import defaultdict
 import json
+from operator import attrgetter
 import os
 import tempfile
 
@@ -80,7 +82,9 @@ class VertexAiRagMemoryService(BaseMemoryService):
       temp_file.write(output_string)
       temp_file_path = temp_file.name
     for rag_resource in self.vertex_rag_store.rag_resources:
-      rag.upload_file(
+      # The upload is a blocking network call; keep it off the event loop.
+      await asyncio.to_thread(
+          rag.upload_file,
           corpus_name=rag_resource.rag_corpus,
           path=temp_file_path,
           # this is the temp workaround as upload file does not support
@@ -95,7 +99,8 @@ class VertexAiRagMemoryService(BaseMemoryService):
       self, *, app_name: str, user_id: str, query: str
   ) -> SearchMemoryResponse:
     """Searches for sessions that match the query using rag.retrieval_query."""
-    response = rag.retrieval_query(
+    response = await asyncio.to_thread(
+        rag.retrieval_query,
         text=query,
         rag_resources=self.vertex_rag_store.rag_resources,
         rag_corpora=self.vertex_rag_store.rag_corpora,
@@ -104,20 +109,21 @@ class VertexAiRagMemoryService(BaseMemoryService):
     )
 
     memory_results = []
-    session_events_map = OrderedDict()
+    session_events_map = defaultdict(list)
     for context in response.contexts.contexts:
       # filter out context that is not related
       # TODO: Add server side filtering by app_name and user_id.
       # if not context.source_display_name.startswith(f"{app_name}.{user_id}."):
       #   continue
-      session_id = context.source_display_name.split(".")[-1]
+      session_id = context.source_display_name.rpartition(".")[2]
       events = []
       if context.text:
         lines = context.text.split("\n")
 
         for line in lines:
           line = line.strip()
-          if not line:
+          # Records are JSON objects; skip anything else without raising.
+          if not line.startswith("{"):
             continue
 
           try:
@@ -128,50 +134,56 @@ class VertexAiRagMemoryService(BaseMemoryService):
             timestamp = float(event_data.get("timestamp", 0))
             text = event_data.get("text", "")
 
-            content = types.Content(parts=[types.Part(text=text)])
-            event = Event(author=author, timestamp=timestamp, content=content)
+            # The records were written by `add_session_to_memory`, so skip
+            # pydantic validation and only build the fields we stored.
+            content = types.Content.model_construct(
+                parts=[types.Part.model_construct(text=text)]
+            )
+            event = Event.model_construct(
+                author=author, timestamp=timestamp, content=content
+            )
             events.append(event)
           except json.JSONDecodeError:
             # Not valid JSON, skip this line
             continue
 
-      if session_id in session_events_map:
-        session_events_map[session_id].append(events)
-      else:
-        session_events_map[session_id] = [events]
+      session_events_map[session_id].append(events)
 
     # Remove overlap and combine events from the same session.
     for session_id, event_lists in session_events_map.items():
       for events in _merge_event_lists(event_lists):
-        sorted_events = sorted(events, key=lambda e: e.timestamp)
+        # The merged lists are built fresh for this search; sort in place.
+        events.sort(key=attrgetter("timestamp"))
         memory_results.append(
-            MemoryResult(session_id=session_id, events=sorted_events)
+            MemoryResult(session_id=session_id, events=events)
         )
     return SearchMemoryResponse(memories=memory_results)
 
 
 def _merge_event_lists(event_lists: list[list[Event]]) -> list[list[Event]]:
   """Merge event lists that have overlapping timestamps."""
+  # Build each list's timestamp set once instead of on every merge pass.
+  pending = [
+      (events, {event.timestamp for event in events}) for events in event_lists
+  ]
   merged = []
-  while event_lists:
-    current = event_lists.pop(0)
-    current_ts = {event.timestamp for event in current}
+  while pending:
+    current, current_ts = pending.pop(0)
     merge_found = True
 
     # Keep merging until no new overlap is found.
     while merge_found:
       merge_found = False
       remaining = []
-      for other in event_lists:
-        other_ts = {event.timestamp for event in other}
+      for other, other_ts in pending:
         # Overlap exists, so we merge and use the merged list to check again
-        if current_ts & other_ts:
+        if not current_ts.isdisjoint(other_ts):
           new_events = [e for e in other if e.timestamp not in current_ts]
           current.extend(new_events)
           current_ts.update(e.timestamp for e in new_events)
           merge_found = True
         else:
-          remaining.append(other)
-      event_lists = remaining
+          remaining.append((other, other_ts))
+      pending = remaining
     merged.append(current)
   return merged
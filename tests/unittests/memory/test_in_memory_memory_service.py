@@ -0,0 +1,119 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Tests for the in-memory memory service."""
+
+from google.adk.events import Event
+from google.adk.memory import InMemoryMemoryService
+from google.adk.sessions import Session
+from google.genai import types
+import pytest
+
+
+def _text_event(author: str, text: str, timestamp: float) -> Event:
+  return Event(
+      author=author,
+      timestamp=timestamp,
+      content=types.Content(parts=[types.Part(text=text)]),
+  )
+
+
+def _session(app_name: str, user_id: str, session_id: str) -> Session:
+  return Session(
+      app_name=app_name,
+      user_id=user_id,
+      id=session_id,
+      events=[
+          _text_event('user', 'What is the Weather today?', 1.0),
+          _text_event('model', 'It is sunny.', 2.0),
+          Event(author='model', timestamp=3.0),
+      ],
+  )
+
+
+@pytest.mark.asyncio
+async def test_search_memory_matches_keywords():
+  service = InMemoryMemoryService()
+  await service.add_session_to_memory(_session('app', 'user', 'session_1'))
+
+  response = await service.search_memory(
+      app_name='app', user_id='user', query='weather'
+  )
+
+  assert len(response.memories) == 1
+  assert response.memories[0].session_id == 'session_1'
+  assert [e.timestamp for e in response.memories[0].events] == [1.0]
+
+
+@pytest.mark.asyncio
+async def test_search_memory_scoped_to_user():
+  service = InMemoryMemoryService()
+  await service.add_session_to_memory(_session('app', 'user', 'session_1'))
+  await service.add_session_to_memory(_session('app', 'other', 'session_2'))
+
+  response = await service.search_memory(
+      app_name='app', user_id='other', query='sunny'
+  )
+
+  assert [m.session_id for m in response.memories] == ['session_2']
+
+
+@pytest.mark.asyncio
+async def test_search_memory_empty_query():
+  service = InMemoryMemoryService()
+  await service.add_session_to_memory(_session('app', 'user', 'session_1'))
+
+  response = await service.search_memory(
+      app_name='app', user_id='user', query='  '
+  )
+
+  assert not response.memories
+
+
+@pytest.mark.asyncio
+async def test_search_memory_session_id_with_separator():
+  service = InMemoryMemoryService()
+  await service.add_session_to_memory(_session('app', 'user', 'a/b'))
+
+  response = await service.search_memory(
+      app_name='app', user_id='user', query='sunny'
+  )
+
+  assert [m.session_id for m in response.memories] == ['a/b']
+
+
+@pytest.mark.asyncio
+async def test_batch_search_memory():
+  service = InMemoryMemoryService()
+  await service.add_session_to_memory(_session('app', 'user', 'session_1'))
+
+  responses = await service.batch_search_memory(
+      app_name='app', user_id='user', queries=['weather', 'rain', 'sunny']
+  )
+
+  assert [len(r.memories) for r in responses] == [1, 0, 1]
+  assert responses[2].memories[0].events[0].timestamp == 2.0
+
+
+@pytest.mark.asyncio
+async def test_search_memory_ids_with_underscores():
+  service = InMemoryMemoryService()
+  await service.add_session_to_memory(_session('app_a', 'b', 'session_1'))
+  await service.add_session_to_memory(_session('app', 'a_b', 'session_2'))
+
+  response = await service.search_memory(
+      app_name='app', user_id='a_b', query='sunny'
+  )
+
+  assert [m.session_id for m in response.memories] == ['session_2']
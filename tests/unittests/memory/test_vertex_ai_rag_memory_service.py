@@ -0,0 +1,149 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Tests for the Vertex AI RAG memory service."""
+
+import json
+from types import SimpleNamespace
+
+from google.adk.events import Event
+from google.adk.memory import vertex_ai_rag_memory_service
+from google.adk.memory import VertexAiRagMemoryService
+from google.adk.sessions import Session
+from google.genai import types
+import pytest
+
+
+def _mock_context(display_name: str, records: list[dict]) -> SimpleNamespace:
+  return SimpleNamespace(
+      source_display_name=display_name,
+      text='\n'.join(json.dumps(record) for record in records),
+  )
+
+
+def _mock_retrieval_response(contexts: list[SimpleNamespace]):
+  return SimpleNamespace(contexts=SimpleNamespace(contexts=contexts))
+
+
+@pytest.fixture
+def mock_retrieval_query(mocker):
+  return mocker.patch.object(
+      vertex_ai_rag_memory_service.rag, 'retrieval_query', autospec=True
+  )
+
+
+@pytest.mark.asyncio
+async def test_search_memory_builds_events(mock_retrieval_query):
+  service = VertexAiRagMemoryService(rag_corpus='corpus')
+  mock_retrieval_query.return_value = _mock_retrieval_response([
+      _mock_context(
+          'app.user.session_1',
+          [
+              {'author': 'model', 'timestamp': 2.0, 'text': 'world'},
+              {'author': 'user', 'timestamp': 1.0, 'text': 'hello'},
+          ],
+      ),
+  ])
+
+  response = await service.search_memory(
+      app_name='app', user_id='user', query='hello'
+  )
+
+  assert len(response.memories) == 1
+  memory = response.memories[0]
+  assert memory.session_id == 'session_1'
+  assert [e.author for e in memory.events] == ['user', 'model']
+  assert [e.timestamp for e in memory.events] == [1.0, 2.0]
+  assert memory.events[0].content.parts[0].text == 'hello'
+  assert memory.events[0].id
+
+
+@pytest.mark.asyncio
+async def test_search_memory_skips_non_json_lines(mock_retrieval_query):
+  service = VertexAiRagMemoryService(rag_corpus='corpus')
+  context = _mock_context(
+      'app.user.session_1',
+      [{'author': 'user', 'timestamp': 1.0, 'text': 'hello'}],
+  )
+  context.text = 'not json\n\n' + context.text
+  mock_retrieval_query.return_value = _mock_retrieval_response([context])
+
+  response = await service.search_memory(
+      app_name='app', user_id='user', query='hello'
+  )
+
+  assert len(response.memories) == 1
+  assert len(response.memories[0].events) == 1
+
+
+@pytest.mark.asyncio
+async def test_add_session_to_memory_uploads_session(mocker):
+  service = VertexAiRagMemoryService(rag_corpus='corpus')
+  mock_upload_file = mocker.patch.object(
+      vertex_ai_rag_memory_service.rag, 'upload_file', autospec=True
+  )
+  session = Session(
+      app_name='app',
+      user_id='user',
+      id='session_1',
+      events=[
+          Event(
+              author='user',
+              timestamp=1.0,
+              content=types.Content(parts=[types.Part(text='hello')]),
+          ),
+          Event(author='model', timestamp=2.0),
+      ],
+  )
+
+  await service.add_session_to_memory(session)
+
+  mock_upload_file.assert_called_once()
+  kwargs = mock_upload_file.call_args.kwargs
+  assert kwargs['corpus_name'] == 'corpus'
+  assert kwargs['display_name'] == 'app.user.session_1'
+
+
+@pytest.mark.asyncio
+async def test_search_memory_merges_overlapping_contexts(mock_retrieval_query):
+  service = VertexAiRagMemoryService(rag_corpus='corpus')
+  mock_retrieval_query.return_value = _mock_retrieval_response([
+      _mock_context(
+          'app.user.session_1',
+          [
+              {'author': 'user', 'timestamp': 1.0, 'text': 'a'},
+              {'author': 'model', 'timestamp': 2.0, 'text': 'b'},
+          ],
+      ),
+      _mock_context(
+          'app.user.session_1',
+          [{'author': 'user', 'timestamp': 5.0, 'text': 'e'}],
+      ),
+      _mock_context(
+          'app.user.session_1',
+          [
+              {'author': 'model', 'timestamp': 2.0, 'text': 'b'},
+              {'author': 'user', 'timestamp': 3.0, 'text': 'c'},
+          ],
+      ),
+  ])
+
+  response = await service.search_memory(
+      app_name='app', user_id='user', query='a'
+  )
+
+  assert [[e.timestamp for e in m.events] for m in response.memories] == [
+      [1.0, 2.0, 3.0],
+      [5.0],
+  ]